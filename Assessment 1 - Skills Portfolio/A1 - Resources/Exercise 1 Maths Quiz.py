@@ -1,307 +1,418 @@
 import tkinter as tk # Import the main tkinter module for GUI creation
-from tkinter import messagebox, ttk, simpledialog  # Import additional tkinter widgets and dialogs
-import random, json, os # Import os for operating system interface file operations
+from tkinter import ttk  # Import additional tkinter widgets
+import os, sys  # Sound file paths and command-line flags
 
 import winsound  # For playing sound effects on Windows
-
-# -------------------- MAIN WINDOW SETUP --------------------
-
-root = tk.Tk()  # Create main application window
-root.title("Arithmetic Quiz Game")  # Set window title
-root.geometry("420x500")  # Fixed window size
-root.resizable(False, False)  # Disable resizing
-
-# -------------------- GLOBAL VARIABLES --------------------
-
-difficulty = score = question_num = first_attempt = time_left = 0  # Initialize game variables
-num1 = num2 = operation = answer_entry = progress_bar = None  # Global widget references
+import tk_diagnostics  # Opt-in event-loop diagnostics (--diagnostics flag)
+from quiz_logic import QuizSession, points_for, QUESTIONS_PER_QUIZ, TIME_PER_QUESTION  # Quiz rules shared with the headless tools
+from quiz_recording import SessionRecorder, recording_dir, new_seed  # Optional session recording (--record flag)
+from score_store import ScoreStore  # Full score history in SQLite
+from leaderboard_view import LeaderboardView  # Paged leaderboard that only draws the visible rows
+import adaptive  # Adaptive difficulty driven by rolling player stats
+from feedback import ToastQueue  # Non-blocking in-window messages instead of message boxes
+
+# -------------------- SHARED RESOURCES --------------------
+# Everything here is created once per process and shared by every quiz window,
+# so extra classroom sessions only pay for their own widgets and state.
+
+RECORD_DIR = recording_dir()  # Folder for session recordings, None when recording is off
+CLASSROOM_FLAG = "--classroom"  # --classroom N opens N quiz windows in this process
+SOUND_ENABLED = True  # The classroom benchmark turns sounds off
+
+_score_store = _profile_store = None  # Opened on first use, then shared
+
+def get_score_store():
+    """Every score ever played (imports the old leaderboard.json on first run)"""
+    global _score_store
+    if _score_store is None:
+        _score_store = ScoreStore()
+    return _score_store
+
+def get_profile_store():
+    """Per-player adaptive stats, one small record each"""
+    global _profile_store
+    if _profile_store is None:
+        _profile_store = adaptive.ProfileStore()
+    return _profile_store
 
 # -------------------- SOUND SETUP -------------------- (online resourse used)
 
+# Dictionary mapping sound types to their corresponding audio files (resolved once, shared by all windows)
+SOUND_FILES = {
+    "correct": "correct_sound_effect.wav", # Sound for correct answers
+    "wrong": "wrong_answer_sound_effect.wav", # Sound for incorrect answers
+    "timeout": "timeout.wav", # Sound for timeout
+    "start": "start.wav" # Sound for Starting
+}
+SOUND_FILES = {name: os.path.abspath(path) for name, path in SOUND_FILES.items()}
+
 def play_sound(sound_type):
     """Play sound effects for correct/wrong/timeout/start"""
+    if not SOUND_ENABLED:
+        return
     try:
-        # Dictionary mapping sound types to their corresponding audio files
-        sound_files = {
-            "correct": "correct_sound_effect.wav", # Sound for correct answers
-            "wrong": "wrong_answer_sound_effect.wav", # Sound for incorrect answers
-            "timeout": "timeout.wav", # Sound for timeout
-            "start": "start.wav" # Sound for Starting
-        }
         # Use SND_FILENAME flag for file playback
-        winsound.PlaySound(sound_files[sound_type], winsound.SND_FILENAME | winsound.SND_ASYNC)
+        winsound.PlaySound(SOUND_FILES[sound_type], winsound.SND_FILENAME | winsound.SND_ASYNC)
     except Exception as e:
         print(f"Sound error: {e}")  # Debug sound issues
 
-# -------------------- LEADERBOARD FUNCTIONS -------------------- (Used online resourse)
-
-def load_leaderboard():
-    """Load leaderboard data from JSON file"""
-    # Check if the leaderboard file exists before attempting to open it
-    if os.path.exists("leaderboard.json"):
-        try:
-            return json.load(open("leaderboard.json"))
-        except:
-            return []
-    return [] # Return empty list if file doesn't exist (first time running app)
-
-def save_leaderboard(data):
-    """Save leaderboard data to JSON file"""
-    json.dump(data, open("leaderboard.json", "w"), indent=2)  # this code is used to Open "leaderboard.json" in write mode and save the data as formatted JSON
-
-def update_leaderboard(name, score):
-    """Add new entry and keep top 5 scores"""
-    data = load_leaderboard()
-    data.append({"name": name, "score": score}) # this code is used to display the name of the user and score 
-    # Sort by score descending and keep top 5
-    data = sorted(data, key=lambda x: x["score"], reverse=True)[:5]
-    save_leaderboard(data)
-
-def show_leaderboard():
-    """Display leaderboard window"""
-    clear_window() # Clear any existing widgets from the window
-    frame = tk.Frame(root, bg="#f0f8ff", bd=2, relief="raised")  # Create a styled frame for the leaderboard
-    frame.place(relx=0.5, rely=0.5, anchor="center", width=350, height=400) # Center the frame in the window
-    
-    tk.Label(frame, text="🏆 LEADERBOARD 🏆", font=("Arial", 22, "bold"), fg="darkorange", bg="#f0f8ff").pack(pady=20)  # Title label for the leaderboard
-    
-    data = load_leaderboard()  # Load leaderboard data from file
-    if not data: # this code Checks if no data exists
-        tk.Label(frame, text="No scores yet. Be the first!", font=("Arial", 14), bg="#f0f8ff").pack(pady=10)
-    else:
-        for i, entry in enumerate(data, 1): # Loop through leaderboard entries with numbering
-            tk.Label(frame, text=f"{i}. {entry['name']} — {entry['score']} pts", font=("Arial", 14), bg="#f0f8ff").pack(pady=3)  # Display each player's name and score
-    
-    tk.Button(frame, text="Back to Menu", font=("Arial", 12), command=displayMenu).pack(pady=20) # Button to return to the main menu
+# -------------------- QUIZ WINDOW --------------------
 
-# -------------------- WELCOME PAGE --------------------
+class QuizApp:
+    """One player's quiz, drawn in a Tk or Toplevel window.
 
-def welcome_page():
-    """Display the welcome screen"""
-    clear_window() # Clear any previous widgets from the window
-    play_sound("start")  # Play start sound
-     # Create the main frame for the welcome screen
-    welcome_frame = tk.Frame(root, bg="#f0f8ff", bd=2, relief="raised") 
-    welcome_frame.place(relx=0.5, rely=0.5, anchor="center", width=350, height=400)
-    
+    All per-player state lives on the instance, so several quizzes can run
+    side by side in one process (see run_classroom).
+    """
 
-    tk.Label(welcome_frame, text="🧮 WELCOME TO", font=("Arial", 20, "bold"), fg="darkblue", bg="#f0f8ff").pack(pady=15) # Display main welcome text
-    tk.Label(welcome_frame, text="ARITHMETIC QUIZ", font=("Arial", 24, "bold"), fg="darkred", bg="#f0f8ff").pack(pady=5)  # Display the game title
-    
-    description_text = """Test your math skills with this fun arithmetic quiz!
-    
-• 10 challenging questions
-• Multiple difficulty levels  
-• Timer-based challenges
-• Leaderboard tracking
-• Instant feedback
-    
-Are you ready to become a math champion?"""
-    tk.Label(welcome_frame, text=description_text, font=("Arial", 11), justify="center", bg="#f0f8ff").pack(pady=20)  # Displays the description label
-    
-    tk.Button(welcome_frame, text="🚀 START QUIZ", font=("Arial", 16, "bold"), 
-              bg="green", fg="white", width=15, height=2, command=displayMenu).pack(pady=20) # Decorative star label at the bottom
-    
-    tk.Label(welcome_frame, text="⭐", font=("Arial", 20), bg="#f0f8ff").pack()
+    def __init__(self, window, title="Arithmetic Quiz Game", on_close=None):
+        self.root = window  # Window this quiz draws in
+        self.on_close = on_close  # Called with this app when its window closes (classroom bookkeeping)
+        self.root.title(title)  # Set window title
+        self.root.geometry("420x500")  # Fixed window size
+        self.root.resizable(False, False)  # Disable resizing
 
-# -------------------- MAIN MENU --------------------
+        self.time_left = 0  # Seconds left on the current question
+        self.timer_job = None  # after() id of the running countdown, cancelled when the question changes
+        self.session = self.recorder = None  # Current QuizSession and its SessionRecorder (if recording)
+        self.answer_entry = self.progress_bar = None  # Widget references for the current question
+        self.player_name = None  # Name entered for the leaderboard (its rank stays pinned on the leaderboard)
+        self.toasts = ToastQueue(self.root, play_sound)  # Queued feedback messages, each with its sound cue
+        self.root.protocol("WM_DELETE_WINDOW", self.close)  # Stop this window's timers when it is closed
 
-def displayMenu():
-    """Show difficulty selection menu"""  # Function to display the difficulty selection screen
-    clear_window()  # Clear all widgets from the previous screen
-    play_sound("start")  # Play a sound when the menu appears
+        self.welcome_page()  # Start game from welcome page
 
-    # Create a frame for the difficulty menu
-    menu_frame = tk.Frame(root, bg="#f0f8ff", bd=2, relief="raised")
-    menu_frame.place(relx=0.5, rely=0.5, anchor="center", width=350, height=450)
+    # -------------------- LEADERBOARD FUNCTIONS --------------------
 
-    # Display main title of the quiz
-    tk.Label(menu_frame, text="🧮 ARITHMETIC QUIZ", font=("Arial", 22, "bold"),
-             fg="darkblue", bg="#f0f8ff").pack(pady=25)
+    def update_leaderboard(self, name, score, level=None):
+        """Add a finished quiz to the score history"""
+        get_score_store().add(name, score, level)  # Stored with its difficulty and date for the leaderboard filters
 
-    # Subtitle asking user to choose difficulty
-    tk.Label(menu_frame, text="Select Difficulty Level", font=("Arial", 14),
-             bg="#f0f8ff").pack(pady=10)
+    def show_leaderboard(self):
+        """Display leaderboard window"""
+        self.clear_window() # Clear any existing widgets from the window
+        frame = tk.Frame(self.root, bg="#f0f8ff", bd=2, relief="raised")  # Create a styled frame for the leaderboard
+        frame.place(relx=0.5, rely=0.5, anchor="center", width=400, height=480) # Center the frame in the window
 
-    # Button for Easy level (single-digit problems)
-    tk.Button(menu_frame, text="1. Easy (Single Digit)", width=25, height=2,
-              command=lambda: start_quiz("easy")).pack(pady=5)
+        tk.Label(frame, text="🏆 LEADERBOARD 🏆", font=("Arial", 22, "bold"), fg="darkorange", bg="#f0f8ff").pack(pady=10)  # Title label for the leaderboard
 
-    # Button for Moderate level (double-digit problems)
-    tk.Button(menu_frame, text="2. Moderate (Double Digit)", width=25, height=2,
-              command=lambda: start_quiz("moderate")).pack(pady=5)
+        store = get_score_store()
+        if store.count() == 0: # this code Checks if no data exists
+            tk.Label(frame, text="No scores yet. Be the first!", font=("Arial", 14), bg="#f0f8ff").pack(pady=10)
+        else:
+            # Only the visible rows are drawn; pages are fetched from the store while scrolling
+            LeaderboardView(frame, store, self.player_name).frame.pack(fill="both", expand=True, padx=5)
 
-    # Button for Advanced level (four-digit problems)
-    tk.Button(menu_frame, text="3. Advanced (Four Digit)", width=25, height=2,
-              command=lambda: start_quiz("advanced")).pack(pady=5)
+        tk.Button(frame, text="Back to Menu", font=("Arial", 12), command=self.displayMenu).pack(pady=10) # Button to return to the main menu
 
-    # Button to open the leaderboard screen
-    tk.Button(menu_frame, text="🏆 View Leaderboard", width=25, height=2,
-              command=show_leaderboard).pack(pady=15)
+    # -------------------- WELCOME PAGE --------------------
 
-    # Button to return back to the welcome screen
-    tk.Button(menu_frame, text="Back to Welcome", width=15,
-              command=welcome_page).pack(pady=5)
+    def welcome_page(self):
+        """Display the welcome screen"""
+        self.clear_window() # Clear any previous widgets from the window
+        play_sound("start")  # Play start sound
+         # Create the main frame for the welcome screen
+        welcome_frame = tk.Frame(self.root, bg="#f0f8ff", bd=2, relief="raised")
+        welcome_frame.place(relx=0.5, rely=0.5, anchor="center", width=350, height=400)
 
-# -------------------- QUIZ LOGIC --------------------
 
-def randomInt(level):
-    """Generate numbers based on difficulty"""  # Function to create random numbers depending on difficulty level
-    
-    if level == "easy":  # If the selected level is Easy
-        return random.randint(1, 9), random.randint(1, 9)  # Return two single-digit numbers
-    
-    elif level == "moderate":  # If the selected level is Moderate
-        return random.randint(10, 99), random.randint(10, 99)  # Return two double-digit numbers
-    
-    else:  # advanced  # If the level is Advanced
-        return random.randint(1000, 9999), random.randint(1000, 9999)  # Return two four-digit numbers
-
-def start_quiz(level):
-    """Initialize quiz session"""
-    global difficulty, score, question_num, first_attempt
-    difficulty, score, question_num, first_attempt = level, 0, 1, True
-    next_question()
-
-def next_question():
-    """Display a new math question"""
-    global num1, num2, operation, answer_entry, first_attempt, time_left, progress_bar
-    
-    if question_num > 10:  # All questions completed
-        displayResults()
-        return
-        
-    clear_window()
-    first_attempt, time_left = True, 10  # Reset attempt and timer
-    
-    quiz_frame = tk.Frame(root, bg="#f0f8ff", bd=2, relief="raised")
-    quiz_frame.place(relx=0.5, rely=0.5, anchor="center", width=350, height=400)
-    
-    tk.Label(quiz_frame, text=f"Question {question_num}/10", font=("Arial", 14, "bold"), fg="darkgreen", bg="#f0f8ff").pack(pady=5)
-    
-    progress_bar = ttk.Progressbar(quiz_frame, length=300, maximum=10, value=question_num-1)
-    progress_bar.pack(pady=5)
-    
-    timer_label = tk.Label(quiz_frame, text=f"⏱️ Time Left: {time_left}s", font=("Arial", 12), fg="red", bg="#f0f8ff")
-    timer_label.pack(pady=5)
-    
-    num1, num2 = randomInt(difficulty)
-    operation = random.choice(["+", "-"])
-    
-    tk.Label(quiz_frame, text=f"{num1} {operation} {num2} =", font=("Arial", 22, "bold"), bg="#f0f8ff").pack(pady=10)
-    
-    answer_entry = tk.Entry(quiz_frame, font=("Arial", 16), justify="center")
-    answer_entry.pack(pady=10)
-    answer_entry.focus()
-    
-    tk.Button(quiz_frame, text="Submit", font=("Arial", 12, "bold"), command=check_answer).pack(pady=10)
-    
-    countdown(timer_label)  # this code Starts countdown timer
-
-def countdown(label):
-    """Countdown timer for question"""
-    global time_left
-    if time_left > 0:
-        time_left -= 1
-        label.config(text=f"⏱️ Time Left: {time_left}s")
-        root.after(1000, countdown, label)
-    else:
-        play_sound("timeout")
-        messagebox.showinfo("Time Up", "⏰ Time's up! Moving to next question.")
-        move_next_question()
+        tk.Label(welcome_frame, text="🧮 WELCOME TO", font=("Arial", 20, "bold"), fg="darkblue", bg="#f0f8ff").pack(pady=15) # Display main welcome text
+        tk.Label(welcome_frame, text="ARITHMETIC QUIZ", font=("Arial", 24, "bold"), fg="darkred", bg="#f0f8ff").pack(pady=5)  # Display the game title
 
-def check_answer():
-    """Check user's input and update score"""
-    global question_num, score, first_attempt
-    try:
-        user_answer = int(answer_entry.get())
-    except ValueError:
-        messagebox.showwarning("Invalid", "Please enter a number.")
-        return
-    
-    correct_answer = num1 + num2 if operation == "+" else num1 - num2
+        description_text = """Test your math skills with this fun arithmetic quiz!
     
-    if user_answer == correct_answer:
-        score += 10 if first_attempt else 5  # Full points for first try, half for second
-        play_sound("correct")
-        messagebox.showinfo("Correct!", f"✅ Correct! (+{10 if first_attempt else 5} points)")
-        move_next_question()
-    else:
-        if first_attempt:
-            first_attempt = False  # Give second chance
-            play_sound("wrong")
-            messagebox.showwarning("Try Again", "❌ Incorrect. Try once more.")
-            answer_entry.delete(0, tk.END)
-        else:
-            play_sound("wrong")  # Move on if wrong twice
-            messagebox.showinfo("Wrong", f"❌ Wrong again! Correct answer: {correct_answer}.")
-            move_next_question()
-
-def move_next_question():
-    """Go to next question"""  # Function to move to the next quiz question
+• 10 challenging questions
+• Multiple difficulty levels  
+• Timer-based challenges
+• Leaderboard tracking
+• Instant feedback
     
-    global question_num  # Use the global variable that tracks the current question number
-    question_num += 1  # Increase the question number by 1
-    next_question()  # Load and display the next question
-
-
-# -------------------- RESULTS SCREEN -------------------- (used Online Resourse)
-
-def displayResults():
-    """Show final score and grade"""  # Function to display the user's final quiz results
-    clear_window()  # Clear the previous screen
-    play_sound("start")  # Play a sound when results are shown
-
-    # Create a frame to display results
-    results_frame = tk.Frame(root, bg="#f0f8ff", bd=2, relief="raised")
-    results_frame.place(relx=0.5, rely=0.5, anchor="center", width=350, height=400)
-
-    # Display completion message
-    tk.Label(results_frame, text="🎉 QUIZ COMPLETED!", font=("Arial", 22, "bold"), 
-             fg="purple", bg="#f0f8ff").pack(pady=20)
-
-    # Display the user's final score
-    tk.Label(results_frame, text=f"Your Final Score: {score}/100", 
-             font=("Arial", 16), bg="#f0f8ff").pack(pady=10)
-
-    # Calculate grade based on score
-    if score >= 90: grade = "A+"  # Excellent performance
-    elif score >= 80: grade = "A"  # Very good performance
-    elif score >= 70: grade = "B"  # Good performance
-    elif score >= 60: grade = "C"  # Average performance
-    else: grade = "F"  # Failing grade
-
-    # Display the calculated grade
-    tk.Label(results_frame, text=f"Your Grade: {grade}", font=("Arial", 16, "bold"), 
-             fg="blue", bg="#f0f8ff").pack(pady=10)
-
-    # Ask user for their name to save score in leaderboard
-    name = simpledialog.askstring("Name", "Enter your name for the leaderboard:")
-    if name:  # If a name was entered
-        update_leaderboard(name, score)  # Save score to leaderboard
-
-    # Button to view the leaderboard
-    tk.Button(results_frame, text="🏆 View Leaderboard", font=("Arial", 12), 
-              command=show_leaderboard).pack(pady=10)
-
-    # Button to restart the quiz
-    tk.Button(results_frame, text="Play Again", font=("Arial", 12), 
-              command=welcome_page).pack(pady=5)
+Are you ready to become a math champion?"""
+        tk.Label(welcome_frame, text=description_text, font=("Arial", 11), justify="center", bg="#f0f8ff").pack(pady=20)  # Displays the description label
 
-    # Button to exit the game
-    tk.Button(results_frame, text="Exit", font=("Arial", 12), 
-              command=root.destroy).pack(pady=5)
+        tk.Button(welcome_frame, text="🚀 START QUIZ", font=("Arial", 16, "bold"),
+                  bg="green", fg="white", width=15, height=2, command=self.displayMenu).pack(pady=20) # Decorative star label at the bottom
+
+        tk.Label(welcome_frame, text="⭐", font=("Arial", 20), bg="#f0f8ff").pack()
 
+    # -------------------- MAIN MENU --------------------
 
-# -------------------- CLEAR WINDOW FUNCTION --------------------
+    def displayMenu(self):
+        """Show difficulty selection menu"""  # Function to display the difficulty selection screen
+        self.clear_window()  # Clear all widgets from the previous screen
+        play_sound("start")  # Play a sound when the menu appears
 
-def clear_window():
-    """Remove all widgets from window"""  # Function to clear all visible elements from the main window
-    for widget in root.winfo_children():  # Loop through every widget currently in the window
-        widget.destroy()  # Delete each widget to clear the screen
-        widget.destroy() # Destroy each widget to remove it from the screen and free memory
+        # Create a frame for the difficulty menu
+        menu_frame = tk.Frame(self.root, bg="#f0f8ff", bd=2, relief="raised")
+        menu_frame.place(relx=0.5, rely=0.5, anchor="center", width=350, height=480)
+
+        # Display main title of the quiz
+        tk.Label(menu_frame, text="🧮 ARITHMETIC QUIZ", font=("Arial", 22, "bold"),
+                 fg="darkblue", bg="#f0f8ff").pack(pady=12)
+
+        # Subtitle asking user to choose difficulty
+        tk.Label(menu_frame, text="Select Difficulty Level", font=("Arial", 14),
+                 bg="#f0f8ff").pack(pady=5)
+
+        # Button for Easy level (single-digit problems)
+        tk.Button(menu_frame, text="1. Easy (Single Digit)", width=25, height=2,
+                  command=lambda: self.start_quiz("easy")).pack(pady=5)
+
+        # Button for Moderate level (double-digit problems)
+        tk.Button(menu_frame, text="2. Moderate (Double Digit)", width=25, height=2,
+                  command=lambda: self.start_quiz("moderate")).pack(pady=5)
+
+        # Button for Advanced level (four-digit problems)
+        tk.Button(menu_frame, text="3. Advanced (Four Digit)", width=25, height=2,
+                  command=lambda: self.start_quiz("advanced")).pack(pady=5)
+
+        # Adaptive level needs to know who is playing to load their stats
+        name_row = tk.Frame(menu_frame, bg="#f0f8ff")
+        name_row.pack(pady=(10, 0))
+        tk.Label(name_row, text="Name:", bg="#f0f8ff").pack(side="left")
+        name_entry = tk.Entry(name_row, width=18)
+        name_entry.insert(0, self.player_name or "")  # Remember the last player
+        name_entry.pack(side="left", padx=5)
+
+        # Button for Adaptive level (questions follow the player's stats)
+        tk.Button(menu_frame, text="4. Adaptive (Made For You)", width=25, height=2,
+                  command=lambda: self.start_adaptive(name_entry.get())).pack(pady=5)
+
+        # Button to open the leaderboard screen
+        tk.Button(menu_frame, text="🏆 View Leaderboard", width=25, height=2,
+                  command=self.show_leaderboard).pack(pady=8)
+
+        # Button to return back to the welcome screen
+        tk.Button(menu_frame, text="Back to Welcome", width=15,
+                  command=self.welcome_page).pack(pady=5)
+
+    # -------------------- QUIZ LOGIC --------------------
+
+    def start_quiz(self, level, stats=None):
+        """Initialize quiz session"""
+        seed = new_seed()  # Seeded so the session can be replayed exactly
+        self.recorder = SessionRecorder(level, seed, RECORD_DIR, stats) if RECORD_DIR else None
+        self.session = QuizSession(level, seed, stats, self.recorder)  # Holds the score, question number and attempts
+        self.next_question()
+
+    def start_adaptive(self, name):
+        """Start an adaptive quiz for the named player"""
+        name = name.strip()
+        if not name:
+            self.toasts.show("Please enter your name to play the adaptive level.", "warning")
+            return
+        self.player_name = name
+        self.start_quiz(adaptive.LEVEL, get_profile_store().load(name))  # One primary-key lookup
+
+    def next_question(self):
+        """Display a new math question"""
+        self.stop_timer()  # The old question's countdown must not keep running
+        question = self.session.next_question()
+        if question is None:  # All questions completed
+            self.displayResults()
+            return
+
+        self.clear_window()
+        self.time_left = TIME_PER_QUESTION  # Reset timer
+
+        quiz_frame = tk.Frame(self.root, bg="#f0f8ff", bd=2, relief="raised")
+        quiz_frame.place(relx=0.5, rely=0.5, anchor="center", width=350, height=400)
+
+        tk.Label(quiz_frame, text=f"Question {self.session.question_num}/{QUESTIONS_PER_QUIZ}", font=("Arial", 14, "bold"), fg="darkgreen", bg="#f0f8ff").pack(pady=5)
+
+        self.progress_bar = ttk.Progressbar(quiz_frame, length=300, maximum=QUESTIONS_PER_QUIZ, value=self.session.question_num-1)
+        self.progress_bar.pack(pady=5)
+
+        timer_label = tk.Label(quiz_frame, text=f"⏱️ Time Left: {self.time_left}s", font=("Arial", 12), fg="red", bg="#f0f8ff")
+        timer_label.pack(pady=5)
+
+        num1, operation, num2 = question
+        tk.Label(quiz_frame, text=f"{num1} {operation} {num2} =", font=("Arial", 22, "bold"), bg="#f0f8ff").pack(pady=10)
+
+        self.answer_entry = tk.Entry(quiz_frame, font=("Arial", 16), justify="center")
+        self.answer_entry.pack(pady=10)
+        self.answer_entry.focus()
+        self.answer_entry.bind("<Return>", lambda event: self.check_answer())  # Enter submits, no mouse needed
+
+        tk.Button(quiz_frame, text="Submit", font=("Arial", 12, "bold"), command=self.check_answer).pack(pady=10)
+
+        self.countdown(timer_label)  # this code Starts countdown timer
+
+    def countdown(self, label):
+        """Countdown timer for question"""
+        if self.time_left > 0:
+            self.time_left -= 1
+            label.config(text=f"⏱️ Time Left: {self.time_left}s")
+            self.timer_job = self.root.after(1000, self.countdown, label)
+        else:
+            self.timer_job = None
+            self.session.timeout()
+            self.toasts.show("⏰ Time's up! Moving to next question.", "warning", sound="timeout")
+            self.move_next_question()
+
+    def stop_timer(self):
+        """Cancel the running countdown (if any)"""
+        if self.timer_job is not None:
+            self.root.after_cancel(self.timer_job)
+            self.timer_job = None
+
+    def check_answer(self):
+        """Check user's input and update score"""
+        outcome = self.session.submit(self.answer_entry.get())
+
+        # Feedback is shown as a toast over the window, so the next question appears straight away
+        if outcome == "invalid":
+            self.toasts.show("Please enter a number.", "warning")
+            self.answer_entry.delete(0, tk.END)
+        elif outcome == "correct":
+            self.toasts.show(f"✅ Correct! (+{points_for(self.session.first_attempt)} points)", "success", sound="correct")
+            self.move_next_question()
+        elif outcome == "retry":
+            self.toasts.show("❌ Incorrect. Try once more.", "error", sound="wrong")  # Give second chance
+            self.answer_entry.delete(0, tk.END)
+        else:
+            self.toasts.show(f"❌ Wrong again! Correct answer: {self.session.answer}.", "error", sound="wrong")  # Move on if wrong twice
+            self.move_next_question()
+
+    def move_next_question(self):
+        """Go to next question"""  # Function to move to the next quiz question
+        self.next_question()  # The session moves on to the next question number itself
+
+    # -------------------- RESULTS SCREEN -------------------- (used Online Resourse)
+
+    def displayResults(self):
+        """Show final score and grade"""  # Function to display the user's final quiz results
+        self.clear_window()  # Clear the previous screen
+        play_sound("start")  # Play a sound when results are shown
+
+        # Create a frame to display results
+        results_frame = tk.Frame(self.root, bg="#f0f8ff", bd=2, relief="raised")
+        results_frame.place(relx=0.5, rely=0.5, anchor="center", width=350, height=420)
+
+        # Display completion message
+        tk.Label(results_frame, text="🎉 QUIZ COMPLETED!", font=("Arial", 22, "bold"),
+                 fg="purple", bg="#f0f8ff").pack(pady=15)
+
+        # Display the user's final score
+        session = self.session
+        score, grade = session.score, session.grade  # Grade bands: A+ 90, A 80, B 70, C 60, else F
+        tk.Label(results_frame, text=f"Your Final Score: {score}/100",
+                 font=("Arial", 16), bg="#f0f8ff").pack(pady=10)
+
+        if self.recorder:
+            self.recorder.save(score, grade)  # Save the finished session for replay
+        if session.stats:
+            get_profile_store().save(self.player_name, session.stats)  # Keep the adaptive stats for next time
+
+        # Display the calculated grade
+        tk.Label(results_frame, text=f"Your Grade: {grade}", font=("Arial", 16, "bold"),
+                 fg="blue", bg="#f0f8ff").pack(pady=10)
+
+        # Ask user for their name to save score in leaderboard (inline, no pop-up)
+        name_row = tk.Frame(results_frame, bg="#f0f8ff")
+        name_row.pack(pady=5)
+        tk.Label(name_row, text="Name:", font=("Arial", 12), bg="#f0f8ff").pack(side="left")
+        name_entry = tk.Entry(name_row, font=("Arial", 12), width=16)
+        name_entry.insert(0, self.player_name or "")
+        name_entry.pack(side="left", padx=5)
+        name_entry.focus()
+
+        def save_name():
+            """Save the score under the typed name (only once)"""
+            name = name_entry.get().strip()
+            if not name:
+                self.toasts.show("Please type your name first.", "warning")
+                return
+            self.player_name = name  # Remember the player so the leaderboard can show their rank
+            self.update_leaderboard(name, score, session.level)  # Save score to leaderboard
+            name_entry.config(state="disabled")
+            save_button.config(state="disabled")
+            self.toasts.show("🏆 Score saved to the leaderboard!", "success")
+
+        save_button = tk.Button(name_row, text="Save", font=("Arial", 11), command=save_name)
+        save_button.pack(side="left")
+        name_entry.bind("<Return>", lambda event: save_name())
+
+        # Button to view the leaderboard
+        tk.Button(results_frame, text="🏆 View Leaderboard", font=("Arial", 12),
+                  command=self.show_leaderboard).pack(pady=10)
+
+        # Button to restart the quiz
+        tk.Button(results_frame, text="Play Again", font=("Arial", 12),
+                  command=self.welcome_page).pack(pady=5)
+
+        # Button to exit the game
+        tk.Button(results_frame, text="Exit", font=("Arial", 12),
+                  command=self.close).pack(pady=5)
+
+    # -------------------- CLEAR WINDOW FUNCTION --------------------
+
+    def clear_window(self):
+        """Remove all widgets from window"""  # Function to clear all visible elements from the main window
+        for widget in self.root.winfo_children():  # Loop through every widget currently in the window
+            if widget is self.toasts.label:
+                continue  # Keep the toast so feedback stays visible on the next screen
+            widget.destroy() # Destroy each widget to remove it from the screen and free memory
+
+    def close(self):
+        """Close this quiz window"""
+        self.stop_timer()
+        self.toasts.clear()
+        self.root.destroy()
+        if self.on_close:
+            self.on_close(self)
+
+# -------------------- CLASSROOM MODE --------------------
+
+def run_classroom(root, count):
+    """Open count quiz windows in this one process, plus a small teacher panel"""
+    apps = []  # QuizApps whose windows are still open
+    opened = [0]  # Student windows opened so far (numbers stay unique after closes)
+
+    def update_count():
+        count_label.config(text=f"{len(apps)} student windows")
+
+    def add_student():
+        window = tk.Toplevel(root)  # Each student gets a light Toplevel, not a new process
+        opened[0] += 1
+        apps.append(QuizApp(window, f"Arithmetic Quiz - Student {opened[0]}", on_close=remove_student))
+        update_count()
+
+    def remove_student(app):
+        apps.remove(app)  # Closed with Exit or the window's close button
+        update_count()
+
+    root.title("Arithmetic Quiz - Classroom")
+    root.geometry("300x160")
+    tk.Label(root, text="🏫 CLASSROOM MODE", font=("Arial", 16, "bold"), fg="darkblue").pack(pady=10)
+    count_label = tk.Label(root, text="", font=("Arial", 12))
+    count_label.pack()
+    tk.Button(root, text="➕ Add Student Window", command=add_student).pack(pady=5)
+    tk.Button(root, text="Close Classroom", command=root.destroy).pack(pady=5)
+
+    for _ in range(count):
+        add_student()
+    return apps
+
+def classroom_size(argv=None):
+    """Number of windows asked for with --classroom N (0 when not in classroom mode)"""
+    argv = sys.argv if argv is None else argv
+    if CLASSROOM_FLAG not in argv:
+        return 0
+    index = argv.index(CLASSROOM_FLAG) + 1
+    return int(argv[index]) if index < len(argv) and argv[index].isdigit() else 30
 
 # -------------------- START APPLICATION --------------------
 
-welcome_page()  # Start game from welcome page
-root.mainloop()  # Run Tkinter main event loop 
\ No newline at end of file
+def main():
+    tk_diagnostics.install("maths_quiz")  # Does nothing unless diagnostics were requested
+    root = tk.Tk()  # Create main application window
+    students = classroom_size()
+    if students:
+        run_classroom(root, students)  # Many quizzes sharing one interpreter, Tk and score store
+    else:
+        QuizApp(root)  # Single player, as before
+    root.mainloop()  # Run Tkinter main event loop
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@ import tkinter as tk  # Import the Tkinter library for GUI
 from tkinter import messagebox  # Import messagebox for pop-up alerts
 import random  # Import random for selecting jokes randomly
 import os  # Import os for file path operations
+import sys  # Import sys so the shared helpers one folder up can be imported
 import winsound  # Import winsound for playing punchline sound on Windows
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Shared helpers live in A1 - Resources
+import tk_diagnostics  # Opt-in event-loop diagnostics (--diagnostics flag)
+
 
 class JokeTellerApp:
     def __init__(self, root):
@@ -497,6 +501,7 @@ class JokeTellerApp:
         except:
             pass
 def main():
+    tk_diagnostics.install("joke_teller")  # Does nothing unless diagnostics were requested
     root = tk.Tk()  # Create main Tkinter window
     app = JokeTellerApp(root)  # Initialize app
     root.mainloop()  # Run Tkinter main loop
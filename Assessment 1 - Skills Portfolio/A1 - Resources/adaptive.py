@@ -0,0 +1,143 @@
+"""Adaptive difficulty for the Arithmetic Quiz.
+
+Each player has a small fixed-size stats record that is updated in O(1)
+after every question:
+
+    accuracy         rolling share of questions answered correctly
+    second_rate      rolling share of questions that needed a second attempt
+    response times   20-bin histogram (0.5 s bins) for the median time
+    skill            0.0 - 3.0, position on the operand ranges in TIERS
+
+The stats decide the operand range and the operation of every question,
+so the difficulty moves during a 10-question session. Records are packed
+with struct into 56 bytes and stored by player name in the score database,
+so loading a profile is a single primary-key lookup.
+"""
+
+import sqlite3  # Profiles live next to the scores
+import struct  # Compact binary profile records
+
+from quiz_logic import TIME_PER_QUESTION
+from score_store import DEFAULT_PATH
+
+LEVEL = "adaptive"  # Difficulty name used for adaptive sessions
+
+# Operand ranges from easiest to hardest (the three fixed levels plus 3 digits)
+TIERS = [(1, 9), (10, 99), (100, 999), (1000, 9999)]
+TIMES_TABLE = (2, 12)  # Operands for multiplication questions
+
+ALPHA = 0.2  # Weight of the newest answer in the rolling averages (~ last 10 answers)
+BIN_MS = 500  # Width of a response time bin
+BINS = TIME_PER_QUESTION * 1000 // BIN_MS  # 20 bins cover the whole question time
+BIN_CAP = 60000  # Halve all bins before any reaches the 16-bit limit
+SKILL_STEP = 0.34  # About three good answers to move up a whole tier
+WARMUP = 3  # Answers needed before the skill starts to move
+
+RECORD = struct.Struct(f"<Ifff{BINS}H")  # answered, accuracy, second_rate, skill, bins
+
+
+class PlayerStats:
+    """Rolling statistics for one player"""
+
+    __slots__ = ("answered", "accuracy", "second_rate", "skill", "bins")
+
+    def __init__(self, answered=0, accuracy=0.75, second_rate=0.0, skill=0.0, bins=None):
+        self.answered = answered  # Questions finished so far
+        self.accuracy = accuracy  # Rolling accuracy (new players start slightly optimistic)
+        self.second_rate = second_rate  # Rolling second-attempt rate
+        self.skill = skill  # 0 = single digit ... 3 = four digit
+        self.bins = list(bins) if bins else [0] * BINS  # Response time histogram
+
+    # ---------- storage ----------
+
+    def pack(self):
+        """56-byte record for storage"""
+        return RECORD.pack(self.answered, self.accuracy, self.second_rate, self.skill, *self.bins)
+
+    @classmethod
+    def unpack(cls, data):
+        """Rebuild stats from a stored record"""
+        answered, accuracy, second_rate, skill, *bins = RECORD.unpack(data)
+        return cls(answered, accuracy, second_rate, skill, bins)
+
+    # ---------- updates ----------
+
+    def median_ms(self):
+        """Median response time from the histogram (middle of the median bin)"""
+        total = sum(self.bins)
+        if total == 0:
+            return TIME_PER_QUESTION * 500  # No data yet: assume half the time
+        seen = 0
+        for index, count in enumerate(self.bins):
+            seen += count
+            if seen * 2 >= total:
+                return index * BIN_MS + BIN_MS // 2
+        return TIME_PER_QUESTION * 1000
+
+    def record(self, correct, second_attempt, elapsed_ms):
+        """Add one finished question (O(1): fixed number of bins)"""
+        self.answered += 1
+        self.accuracy += ALPHA * ((1.0 if correct else 0.0) - self.accuracy)
+        self.second_rate += ALPHA * ((1.0 if second_attempt else 0.0) - self.second_rate)
+
+        index = min(BINS - 1, max(0, int(elapsed_ms) // BIN_MS))
+        self.bins[index] += 1
+        if self.bins[index] >= BIN_CAP:
+            self.bins = [count // 2 for count in self.bins]  # Age old answers out
+
+        if self.answered >= WARMUP:
+            self.adjust_skill(correct and not second_attempt)
+
+    def adjust_skill(self, clean_answer):
+        """Move the skill up or down based on the rolling stats and the last answer"""
+        fast = self.median_ms() <= TIME_PER_QUESTION * 1000 * 0.5
+        slow = self.median_ms() >= TIME_PER_QUESTION * 1000 * 0.8
+        if clean_answer and self.accuracy >= 0.8 and self.second_rate <= 0.2 and fast:
+            self.skill = min(len(TIERS) - 1.0, self.skill + SKILL_STEP)
+        elif not clean_answer and (self.accuracy < 0.6 or self.second_rate > 0.4 or slow):
+            self.skill = max(0.0, self.skill - SKILL_STEP)
+
+    # ---------- question choice ----------
+
+    def operations(self):
+        """Operations the player is ready for"""
+        ops = ["+"]
+        if self.skill >= 0.5:
+            ops.append("-")
+        if self.skill >= 1.5 and self.accuracy >= 0.7 and self.second_rate <= 0.3:
+            ops.append("×")
+        return ops
+
+    def make_question(self, rng):
+        """Pick (num1, operation, num2) for the next question"""
+        tier = int(self.skill)
+        if tier < len(TIERS) - 1 and rng.random() < self.skill - tier:
+            tier += 1  # Part way to the next tier: sometimes use it
+        operation = rng.choice(self.operations())
+        if operation == "×":
+            low, high = TIMES_TABLE
+            return rng.randint(low, high), operation, rng.randint(low, high)
+        low, high = TIERS[tier]
+        return rng.randint(low, high), operation, rng.randint(low, high)
+
+
+class ProfileStore:
+    """Player stats records keyed by name"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS player_profiles "
+                        "(name TEXT PRIMARY KEY, stats BLOB NOT NULL) WITHOUT ROWID")
+
+    def load(self, name):
+        """Stats for a player (fresh stats for a new player)"""
+        row = self.db.execute("SELECT stats FROM player_profiles WHERE name = ?", (name,)).fetchone()
+        return PlayerStats.unpack(row[0]) if row else PlayerStats()
+
+    def save(self, name, stats):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO player_profiles (name, stats) VALUES (?, ?)",
+                            (name, stats.pack()))
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,187 @@
+"""Benchmark for classroom mode of the Arithmetic Quiz.
+
+Opens N quiz windows in one process (default 30), lets a bot play every
+session at once, and reports:
+
+    * memory (RSS) of one standalone quiz process, for comparison
+    * extra memory per classroom session
+    * event-loop responsiveness: lateness of a 20 ms heartbeat timer and
+      how long each simulated answer takes to handle
+
+Run it from this folder (the quiz loads its sound files from here):
+    python classroom_benchmark.py [--sessions 30] [--seconds 20]
+"""
+
+import argparse  # Command-line options
+import ctypes  # Memory usage on Windows
+import importlib.util  # Load the quiz script (its file name has spaces)
+import os  # Paths
+import random  # Bot answer timing
+import subprocess  # Measure a standalone quiz process
+import sys  # Interpreter path
+import time  # Timing
+import tkinter as tk  # Main tkinter module
+
+QUIZ_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Exercise 1 Maths Quiz.py")
+HEARTBEAT_MS = 20  # Heartbeat timer interval
+
+
+def load_quiz():
+    """Import the quiz script as a module without starting it"""
+    spec = importlib.util.spec_from_file_location("maths_quiz", QUIZ_FILE)
+    quiz = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(quiz)
+    quiz.SOUND_ENABLED = False  # 30 windows of sound effects would only get in the way
+    return quiz
+
+
+def rss_bytes():
+    """Resident memory of this process"""
+    try:
+        import psutil  # Optional, used when installed
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    if sys.platform == "win32":
+        from ctypes import wintypes
+
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + \
+                [(name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+        counters = Counters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+        return counters.WorkingSetSize
+    with open("/proc/self/status") as status:  # Linux
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def settle(root):
+    """Let Tk draw everything that is pending"""
+    for _ in range(3):
+        root.update()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def standalone_rss():
+    """RSS of a separate process running one ordinary quiz window"""
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--standalone"],
+                            capture_output=True, text=True, check=True).stdout
+    return int(output.split()[-1])
+
+
+def run_standalone():
+    """Child process: one quiz window, then print its RSS"""
+    quiz = load_quiz()
+    root = tk.Tk()
+    app = quiz.QuizApp(root)
+    app.start_quiz("easy")
+    settle(root)
+    print(rss_bytes())
+    root.destroy()
+
+# -------------------- BOT PLAYERS --------------------
+
+class Bot:
+    """Plays one QuizApp: answers after a short think, mostly correctly"""
+
+    def __init__(self, root, app, timings):
+        self.root = root
+        self.app = app
+        self.timings = timings  # Shared list of answer handling times (ms)
+        self.answers = 0
+
+    def schedule(self):
+        self.root.after(random.randint(300, 2500), self.act)
+
+    def act(self):
+        app = self.app
+        if app.session is None or app.session.finished:
+            app.start_quiz(random.choice(["easy", "moderate", "advanced"]))  # Results screen: play again
+        else:
+            answer = app.session.answer + (0 if random.random() < 0.8 else 1)
+            app.answer_entry.delete(0, tk.END)
+            app.answer_entry.insert(0, str(answer))
+            start = time.perf_counter()
+            app.check_answer()
+            self.timings.append((time.perf_counter() - start) * 1000)
+            self.answers += 1
+        self.schedule()
+
+# -------------------- BENCHMARK --------------------
+
+def run(sessions, seconds):
+    standalone = standalone_rss()
+
+    quiz = load_quiz()
+    root = tk.Tk()
+    root.withdraw()  # The panel is not needed for the benchmark
+    settle(root)
+    base = rss_bytes()  # Interpreter + Tk + quiz modules, no quiz windows yet
+
+    apps = [quiz.QuizApp(tk.Toplevel(root), f"Student {n + 1}") for n in range(sessions)]
+    for app in apps:
+        app.start_quiz("easy")
+    settle(root)
+    with_sessions = rss_bytes()
+
+    # Play every session at once and watch how late a steady heartbeat fires
+    lags = []
+    timings = []
+    due = [time.perf_counter() + HEARTBEAT_MS / 1000]
+
+    def heartbeat():
+        now = time.perf_counter()
+        lags.append((now - due[0]) * 1000)
+        due[0] = now + HEARTBEAT_MS / 1000
+        root.after(HEARTBEAT_MS, heartbeat)
+
+    bots = [Bot(root, app, timings) for app in apps]
+    for bot in bots:
+        bot.schedule()
+    root.after(HEARTBEAT_MS, heartbeat)
+    root.after(int(seconds * 1000), root.quit)
+    root.mainloop()
+    peak = rss_bytes()
+    root.destroy()
+
+    mib = 1024 * 1024
+    per_session = (with_sessions - base) / sessions
+    answers = sum(bot.answers for bot in bots)
+    print(f"Standalone quiz process:   {standalone / mib:8.1f} MiB")
+    print(f"Classroom base process:    {base / mib:8.1f} MiB")
+    print(f"With {sessions} sessions:       {with_sessions / mib:8.1f} MiB  (after play: {peak / mib:.1f} MiB)")
+    print(f"Per session:               {per_session / mib:8.2f} MiB  "
+          f"({per_session / standalone:.1%} of a standalone process)")
+    print(f"{sessions} separate processes:  {sessions * standalone / mib:8.1f} MiB")
+    print(f"Heartbeat lag ({HEARTBEAT_MS} ms timer): mean {sum(lags) / max(1, len(lags)):.1f} ms, "
+          f"p95 {percentile(lags, 0.95):.1f} ms, max {max(lags, default=0):.1f} ms")
+    print(f"Answers handled: {answers} in {seconds:.0f} s ({answers * 60 / seconds:.0f}/min), "
+          f"handling time p95 {percentile(timings, 0.95):.1f} ms, max {max(timings, default=0):.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure memory and responsiveness of classroom mode.")
+    parser.add_argument("--sessions", type=int, default=30, help="quiz windows to open")
+    parser.add_argument("--seconds", type=float, default=20, help="how long the bots play")
+    parser.add_argument("--standalone", action="store_true", help=argparse.SUPPRESS)  # Child process mode
+    args = parser.parse_args(argv)
+    if args.standalone:
+        run_standalone()
+    else:
+        run(args.sessions, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
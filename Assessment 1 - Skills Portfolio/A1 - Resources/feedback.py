@@ -0,0 +1,60 @@
+"""In-window toast messages that replace modal message boxes.
+
+A messagebox runs its own nested event loop: timers stall, the window stops
+redrawing and the player has to click OK. Toasts are a label drawn over the
+window instead. They queue up, disappear by themselves after a short time
+and never block the main loop.
+"""
+
+import tkinter as tk  # Main tkinter module
+from collections import deque  # Queue of waiting toasts
+
+# Colours for each kind of message
+STYLES = {
+    "info": ("#d9edf7", "#31708f"),
+    "success": ("#dff0d8", "#3c763d"),
+    "warning": ("#fcf8e3", "#8a6d3b"),
+    "error": ("#f2dede", "#a94442"),
+}
+DEFAULT_MS = 1200  # How long a toast stays up
+QUEUED_MS = 600  # Shorter time when more toasts are waiting
+
+
+class ToastQueue:
+    """Shows one toast at a time at the top of a window"""
+
+    def __init__(self, root, sound=None):
+        self.root = root  # Window the toasts are drawn in
+        self.sound = sound  # Function called with a sound name when a toast is shown
+        self.waiting = deque()  # (text, kind, ms, sound) not shown yet
+        self.job = None  # after() id of the running dismiss timer
+        self.label = tk.Label(root, font=("Arial", 12, "bold"), bd=1, relief="solid", padx=10, pady=4)
+
+    def show(self, text, kind="info", ms=DEFAULT_MS, sound=None):
+        """Queue a toast; the sound (if any) plays when it appears"""
+        self.waiting.append((text, kind, ms, sound))
+        if self.job is None:
+            self._next()
+
+    def _next(self):
+        """Show the next waiting toast, or hide the label"""
+        if not self.waiting:
+            self.job = None
+            self.label.place_forget()
+            return
+        text, kind, ms, sound = self.waiting.popleft()
+        bg, fg = STYLES.get(kind, STYLES["info"])
+        self.label.config(text=text, bg=bg, fg=fg)
+        self.label.place(relx=0.5, y=8, anchor="n")  # Top margin, clear of the centre frames
+        self.label.lift()
+        if sound and self.sound:
+            self.sound(sound)  # Sound cue fired alongside the toast
+        self.job = self.root.after(QUEUED_MS if self.waiting else ms, self._next)
+
+    def clear(self):
+        """Drop waiting toasts and hide the current one"""
+        self.waiting.clear()
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+        self.label.place_forget()
@@ -0,0 +1,188 @@
+"""Paged, virtualised leaderboard for the Arithmetic Quiz.
+
+Only VISIBLE_ROWS rows exist in the Treeview at any time. Scrolling moves a
+window over the score store and fetches rows a page at a time (with a small
+cache), so opening and scrolling stay fast however many scores are stored.
+"""
+
+import tkinter as tk  # Main tkinter module
+from collections import OrderedDict  # Small LRU cache of pages
+from datetime import datetime, timedelta  # Date range filter
+from tkinter import ttk  # Treeview, Combobox and Scrollbar
+
+VISIBLE_ROWS = 10  # Rows shown at once
+PAGE_SIZE = 50  # Rows fetched per database query
+CACHED_PAGES = 20  # Pages kept in memory
+LEVELS = ["All", "easy", "moderate", "advanced", "adaptive"]  # Difficulty filter choices
+DATE_FORMAT = "%Y-%m-%d"  # Format for the From/To boxes
+
+
+class LeaderboardView:
+    """Leaderboard widget showing one window of rows from a ScoreStore"""
+
+    def __init__(self, parent, store, player_name=None, bg="#f0f8ff"):
+        self.store = store  # ScoreStore to read from
+        self.player_name = player_name  # Player whose rank stays pinned at the bottom
+        self.filters = {}  # difficulty / since / until for the store queries
+        self.total = 0  # Rows matching the filters
+        self.offset = 0  # Index of the first visible row
+        self.pages = OrderedDict()  # page number -> rows
+        self.player_row = None  # (rank, name, score, level, played_at) of the player's best
+
+        self.frame = tk.Frame(parent, bg=bg)
+
+        # Filter bar: difficulty and date range
+        filter_bar = tk.Frame(self.frame, bg=bg)
+        filter_bar.pack(fill="x", pady=5)
+        self.level_box = ttk.Combobox(filter_bar, values=LEVELS, width=9, state="readonly")
+        self.level_box.current(0)
+        self.level_box.pack(side="left", padx=2)
+        self.level_box.bind("<<ComboboxSelected>>", lambda event: self.apply_filters())
+        tk.Label(filter_bar, text="From", bg=bg).pack(side="left")
+        self.since_entry = tk.Entry(filter_bar, width=10)
+        self.since_entry.pack(side="left", padx=2)
+        tk.Label(filter_bar, text="To", bg=bg).pack(side="left")
+        self.until_entry = tk.Entry(filter_bar, width=10)
+        self.until_entry.pack(side="left", padx=2)
+        tk.Button(filter_bar, text="Go", command=self.apply_filters).pack(side="left", padx=2)
+
+        # Table with a scrollbar that we drive ourselves
+        table = tk.Frame(self.frame, bg=bg)
+        table.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(table, columns=("rank", "name", "score", "level", "date"),
+                                 show="headings", height=VISIBLE_ROWS, selectmode="browse")
+        for column, title, width in [("rank", "#", 55), ("name", "Name", 110), ("score", "Score", 50),
+                                     ("level", "Level", 70), ("date", "Date", 80)]:
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=width, anchor="center", stretch=False)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.bind("<MouseWheel>", self.on_wheel)  # Windows / macOS
+        self.tree.bind("<Button-4>", lambda event: self.scroll_to(self.offset - 3))  # Linux wheel up
+        self.tree.bind("<Button-5>", lambda event: self.scroll_to(self.offset + 3))  # Linux wheel down
+        self.tree.bind("<Up>", lambda event: self.scroll_to(self.offset - 1))
+        self.tree.bind("<Down>", lambda event: self.scroll_to(self.offset + 1))
+        self.tree.bind("<Prior>", lambda event: self.scroll_to(self.offset - VISIBLE_ROWS))
+        self.tree.bind("<Next>", lambda event: self.scroll_to(self.offset + VISIBLE_ROWS))
+        for row in range(VISIBLE_ROWS):
+            self.tree.insert("", "end", iid=str(row), values=("", "", "", "", ""))  # Fixed set of row items
+        self.tree.tag_configure("me", background="#ffe9a8")
+
+        # Pinned "your rank" line
+        self.me_label = tk.Label(self.frame, text="", font=("Arial", 11, "bold"), fg="darkblue", bg=bg,
+                                 cursor="hand2")
+        self.me_label.pack(pady=4)
+        self.me_label.bind("<Button-1>", lambda event: self.jump_to_player())
+
+        self.apply_filters()
+
+    # ---------- filters ----------
+
+    def _read_date(self, entry, extra_days=0):
+        """Timestamp from a From/To box, or None if it is blank or invalid"""
+        text = entry.get().strip()
+        if not text:
+            return None
+        try:
+            return (datetime.strptime(text, DATE_FORMAT) + timedelta(days=extra_days)).timestamp()
+        except ValueError:
+            entry.delete(0, tk.END)  # Clear a bad date rather than guessing
+            return None
+
+    def apply_filters(self):
+        """Re-count and redraw for the current filter settings"""
+        level = self.level_box.get()
+        self.filters = {
+            "difficulty": None if level == "All" else level,
+            "since": self._read_date(self.since_entry),
+            "until": self._read_date(self.until_entry, extra_days=1),  # "To" date is inclusive
+        }
+        self.pages.clear()
+        self.total = self.store.count(**self.filters)
+        self.offset = 0
+        self.player_row = None
+        self.me_label.config(text="")
+        self.render()
+        self.frame.after_idle(self.update_player_rank)  # Rank lookup after the first rows are drawn
+
+    # ---------- paging ----------
+
+    def get_page(self, number):
+        """Rows of one page, from the cache or the store"""
+        if number in self.pages:
+            self.pages.move_to_end(number)
+            return self.pages[number]
+        rows = self.store.page(number * PAGE_SIZE, PAGE_SIZE, **self.filters)
+        self.pages[number] = rows
+        if len(self.pages) > CACHED_PAGES:
+            self.pages.popitem(last=False)  # Drop the least recently used page
+        return rows
+
+    def visible_rows(self):
+        """Rows for the current window (at most two pages are touched)"""
+        first_page = self.offset // PAGE_SIZE
+        last_page = (self.offset + VISIBLE_ROWS - 1) // PAGE_SIZE
+        rows = []
+        for number in range(first_page, last_page + 1):
+            rows.extend(self.get_page(number))
+        start = self.offset - first_page * PAGE_SIZE
+        return rows[start:start + VISIBLE_ROWS]
+
+    def render(self):
+        """Fill the fixed row items with the current window"""
+        rows = self.visible_rows()
+        my_rank = self.player_row[0] if self.player_row else None
+        for index in range(VISIBLE_ROWS):
+            if index < len(rows):
+                rank, name, score, level, played_at = rows[index]
+                date = datetime.fromtimestamp(played_at).strftime(DATE_FORMAT) if played_at else "-"
+                values = (rank, name, score, level or "-", date)
+                tags = ("me",) if rank == my_rank else ()
+            else:
+                values, tags = ("", "", "", "", ""), ()
+            self.tree.item(str(index), values=values, tags=tags)
+        if self.total > VISIBLE_ROWS:
+            self.scrollbar.set(self.offset / self.total, (self.offset + VISIBLE_ROWS) / self.total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll_to(self, offset):
+        """Move the window so that row 'offset' is at the top"""
+        offset = max(0, min(offset, self.total - VISIBLE_ROWS))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+        return "break"  # Stop the Treeview handling the key itself
+
+    def on_scrollbar(self, action, amount, unit=None):
+        """Handle drags and clicks on the scrollbar"""
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.total))
+        elif action == "scroll":
+            step = VISIBLE_ROWS if unit == "pages" else 1
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def on_wheel(self, event):
+        """Mouse wheel on Windows/macOS"""
+        return self.scroll_to(self.offset - (3 if event.delta > 0 else -3))
+
+    # ---------- player's own rank ----------
+
+    def update_player_rank(self):
+        """Look up the player's best rank under the current filters"""
+        if not self.player_name:
+            return
+        self.player_row = self.store.best_rank(self.player_name, **self.filters)
+        if self.player_row is None:
+            self.me_label.config(text=f"{self.player_name}: no scores for these filters")
+            return
+        rank, name, score, _, _ = self.player_row
+        self.me_label.config(text=f"⭐ You: #{rank} {name} — {score} pts (click to show)")
+        self.render()  # Highlight the player's row if it is on screen
+
+    def jump_to_player(self):
+        """Scroll so the player's row is in the middle of the view"""
+        if self.player_row:
+            self.scroll_to(self.player_row[0] - 1 - VISIBLE_ROWS // 2)
+            self.tree.selection_set(str(min(self.player_row[0] - 1 - self.offset, VISIBLE_ROWS - 1)))
@@ -0,0 +1,272 @@
+"""Printable worksheets and offline grading for the Arithmetic Quiz.
+
+Worksheets use the same seeded question generator as the quiz, so a
+worksheet's seed and level are enough to rebuild its answer key.
+
+Generate 30 easy worksheets (one text file each, plus answer_keys.csv):
+    python quiz_batch.py generate 30 --level easy --out worksheets
+
+Grade completed submission files (CSV, one submission per row):
+    student,level,seed,q1,q2,...,q10
+    Jake Hobbs,easy,1000,7,12/13,,4,...
+
+Each answer cell is the first attempt, optionally followed by "/" and a
+second attempt. Scoring matches the quiz: 10 points for a correct first
+attempt, 5 for a correct second attempt, nothing for blanks or anything
+else. Files are graded in parallel, one file per worker process:
+    python quiz_batch.py grade submissions/*.csv --out graded
+Files that cannot be read are listed under "failed_files" in the class
+summary and make the command exit with status 1; the rest are still graded.
+"""
+
+import argparse  # Command-line options
+import csv  # Submission and result files
+import json  # Class summary output
+import os  # File paths
+import random  # Seeded question generator
+import sys  # Exit status
+import time  # Timing
+from functools import lru_cache  # Answer keys are reused by many students
+from multiprocessing import Pool  # Grade files across all CPU cores
+
+from quiz_logic import (GRADE_THRESHOLDS, LEVEL_RANGES, QUESTIONS_PER_QUIZ,
+                        correct_answer, grade_for, make_question, points_for)
+
+GRADES = [grade for _, grade in GRADE_THRESHOLDS] + ["F"]  # A+, A, B, C, F
+
+# -------------------- WORKSHEETS --------------------
+
+def worksheet_questions(level, seed):
+    """The 10 questions a quiz session with this seed would ask"""
+    rng = random.Random(seed)  # Same generator and call order as QuizSession
+    return [make_question(level, rng) for _ in range(QUESTIONS_PER_QUIZ)]
+
+
+@lru_cache(maxsize=65536)
+def answer_key(level, seed):
+    """Correct answers for a worksheet as (number, text) pairs.
+
+    Cached because many students share a worksheet. The text form lets the
+    grader match the usual case without converting every cell to int.
+    """
+    return tuple((answer, str(answer)) for answer in
+                 (correct_answer(*question) for question in worksheet_questions(level, seed)))
+
+
+def write_worksheet(folder, level, seed):
+    """Write one printable worksheet and return its answer key"""
+    questions = worksheet_questions(level, seed)
+    path = os.path.join(folder, f"worksheet-{level}-{seed}.txt")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"ARITHMETIC QUIZ - {level.title()} - Worksheet {seed}\n")
+        file.write("Name: ______________________\n\n")
+        for number, (num1, operation, num2) in enumerate(questions, 1):
+            file.write(f"{number:2d}.  {num1} {operation} {num2} = ________\n\n")
+    return [correct_answer(*question) for question in questions]
+
+
+def generate(count, level, folder, first_seed):
+    """Write count worksheets and an answer_keys.csv"""
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, "answer_keys.csv"), "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["level", "seed"] + [f"q{n}" for n in range(1, QUESTIONS_PER_QUIZ + 1)])
+        for seed in range(first_seed, first_seed + count):
+            writer.writerow([level, seed] + write_worksheet(folder, level, seed))
+
+
+def seed_arg(text):
+    """argparse type for seeds: Random(-n) gives the same questions as Random(n)"""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"seed must be a whole number, got {text!r}")
+    if seed < 0:
+        raise argparse.ArgumentTypeError(f"seed must be 0 or more, got {seed}")
+    return seed
+
+# -------------------- GRADING --------------------
+
+FIRST_POINTS = points_for(True)  # 10
+SECOND_POINTS = points_for(False)  # 5
+
+
+def _matches(text, expected, expected_text):
+    """True if an answer cell attempt equals the expected answer"""
+    if text == expected_text:
+        return True  # Usual case, no conversion needed
+    try:
+        return int(text) == expected  # Handles spaces, leading zeros, "+7"
+    except ValueError:
+        return False  # Blank or not a number
+
+
+def score_answers(key, cells, question_correct=None):
+    """Score one row of answer cells against a key.
+
+    If question_correct is given, the count for each correctly answered
+    question is increased in place.
+    """
+    score = 0
+    for number, ((expected, expected_text), cell) in enumerate(zip(key, cells)):
+        if cell == expected_text:
+            score += FIRST_POINTS  # Right first time, nothing to split or parse
+        else:
+            first, _, second = cell.partition("/")
+            if _matches(first, expected, expected_text):
+                score += FIRST_POINTS
+            elif second and _matches(second, expected, expected_text):
+                score += SECOND_POINTS
+            else:
+                continue
+        if question_correct is not None:
+            question_correct[number] += 1
+    return score
+
+
+def new_totals():
+    """Empty class-level aggregates"""
+    return {
+        "submissions": 0,
+        "score_total": 0,
+        "grades": dict.fromkeys(GRADES, 0),
+        "question_correct": [0] * QUESTIONS_PER_QUIZ,
+        "levels": {},  # level -> [submissions, score total]
+        "rejected": 0,  # Rows with an unknown level or bad seed
+    }
+
+
+def grade_rows(path, out_path):
+    """Grade one submission file, writing per-student results; returns totals"""
+    totals = new_totals()
+    with open(path, newline="", encoding="utf-8") as source, \
+            open(out_path, "w", newline="", encoding="utf-8") as target:
+        reader = csv.reader(source)
+        writer = csv.writer(target)
+        writer.writerow(["student", "level", "seed", "score", "grade"])
+        next(reader, None)  # Skip the header row
+        grades = totals["grades"]
+        question_correct = totals["question_correct"]
+        levels = totals["levels"]
+        for row in reader:
+            try:
+                seed = int(row[2])
+            except (IndexError, ValueError):
+                seed = None
+            if seed is None or seed < 0 or row[1] not in LEVEL_RANGES:  # Random(-n) repeats seed n
+                totals["rejected"] += 1
+                continue
+            student, level = row[0], row[1]
+            score = score_answers(answer_key(level, seed), row[3:], question_correct)
+            grade = grade_for(score)
+            writer.writerow([student, level, seed, score, grade])
+
+            totals["submissions"] += 1
+            totals["score_total"] += score
+            grades[grade] += 1
+            level_totals = levels.setdefault(level, [0, 0])
+            level_totals[0] += 1
+            level_totals[1] += score
+    return totals
+
+
+def grade_file(job):
+    """Grade one file for the process pool; errors are returned, not raised"""
+    path, out_path = job
+    try:
+        return path, grade_rows(path, out_path)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        if os.path.exists(out_path):
+            os.remove(out_path)  # Don't leave half a results file behind
+        return path, {"error": str(e)}
+
+
+def merge_totals(into, part):
+    """Add one file's totals to the class totals"""
+    into["submissions"] += part["submissions"]
+    into["score_total"] += part["score_total"]
+    into["rejected"] += part["rejected"]
+    for grade, count in part["grades"].items():
+        into["grades"][grade] += count
+    for number, count in enumerate(part["question_correct"]):
+        into["question_correct"][number] += count
+    for level, (count, total) in part["levels"].items():
+        level_totals = into["levels"].setdefault(level, [0, 0])
+        level_totals[0] += count
+        level_totals[1] += total
+
+
+def class_summary(totals, failed=None):
+    """Turn raw totals into the class-level report"""
+    count = totals["submissions"]
+    return {
+        "submissions": count,
+        "rejected_rows": totals["rejected"],
+        "failed_files": failed or {},  # path -> error, files that could not be graded
+        "average_score": round(totals["score_total"] / count, 2) if count else 0.0,
+        "grade_distribution": totals["grades"],
+        "question_accuracy": [round(c / count, 3) if count else 0.0 for c in totals["question_correct"]],
+        "average_by_level": {level: round(total / n, 2) for level, (n, total) in sorted(totals["levels"].items())},
+    }
+
+
+def output_names(paths):
+    """Result file name for each submission file (numbered if two share a name)"""
+    names = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    if len(set(names)) == len(names):
+        return [name + ".graded.csv" for name in names]
+    return [f"{number:03d}-{name}.graded.csv" for number, name in enumerate(names, 1)]
+
+
+def grade(paths, out_folder, workers=None):
+    """Grade submission files in parallel (one file per task); returns the class summary"""
+    os.makedirs(out_folder, exist_ok=True)
+    totals = new_totals()
+    failed = {}
+    jobs = [(path, os.path.join(out_folder, name)) for path, name in zip(paths, output_names(paths))]
+    with Pool(min(workers or os.cpu_count() or 1, len(jobs) or 1)) as pool:
+        for path, part in pool.imap_unordered(grade_file, jobs):
+            if "error" in part:
+                failed[path] = part["error"]  # The other files still count
+            else:
+                merge_totals(totals, part)
+    summary = class_summary(totals, dict(sorted(failed.items())))
+    with open(os.path.join(out_folder, "class_summary.json"), "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=2)
+    return summary
+
+# -------------------- COMMAND LINE --------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Arithmetic Quiz worksheets and offline grading.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    make = commands.add_parser("generate", help="write seeded worksheets with answer keys")
+    make.add_argument("count", type=int, help="number of worksheets")
+    make.add_argument("--level", choices=list(LEVEL_RANGES), default="easy")
+    make.add_argument("--out", default="worksheets", help="output folder")
+    make.add_argument("--first-seed", type=seed_arg, default=1000, help="seed of the first worksheet")
+
+    mark = commands.add_parser("grade", help="grade CSV submission files")
+    mark.add_argument("files", nargs="+", help="submission CSV files")
+    mark.add_argument("--out", default="graded", help="folder for per-student results")
+    mark.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+
+    args = parser.parse_args(argv)
+    if args.command == "generate":
+        generate(args.count, args.level, args.out, args.first_seed)
+        print(f"Wrote {args.count} {args.level} worksheets to {args.out}")
+        return 0
+
+    start = time.perf_counter()
+    summary = grade(args.files, args.out, args.workers)
+    elapsed = time.perf_counter() - start
+    print(json.dumps(summary, indent=2))
+    print(f"Graded {summary['submissions']} submissions in {elapsed:.2f} s")
+    for path, error in summary["failed_files"].items():
+        print(f"ERROR    {path}: {error}")
+    return 1 if summary["failed_files"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Quiz rules for the Arithmetic Quiz, kept free of Tkinter.
+
+The GUI, the session recorder/replayer and the batch tools all use these
+functions so that questions, scoring and grades are worked out the same way
+everywhere.
+"""
+
+import random  # Random numbers for questions
+import time  # Session clock
+
+# -------------------- QUIZ SETTINGS --------------------
+
+QUESTIONS_PER_QUIZ = 10  # Each play of the quiz is 10 questions
+TIME_PER_QUESTION = 10  # Seconds allowed per question
+FIRST_ATTEMPT_POINTS = 10  # Points for a correct first answer
+SECOND_ATTEMPT_POINTS = 5  # Points for a correct second answer
+
+# Operand ranges for each difficulty level
+LEVEL_RANGES = {
+    "easy": (1, 9),  # Single digit
+    "moderate": (10, 99),  # Double digit
+    "advanced": (1000, 9999),  # Four digit
+}
+
+# Grade boundaries, checked from the top down
+GRADE_THRESHOLDS = [(90, "A+"), (80, "A"), (70, "B"), (60, "C")]
+
+# -------------------- QUESTION FUNCTIONS --------------------
+
+def randomInt(level, rng=random):
+    """Generate numbers based on difficulty"""
+    low, high = LEVEL_RANGES.get(level, LEVEL_RANGES["advanced"])  # Unknown levels count as advanced
+    return rng.randint(low, high), rng.randint(low, high)  # Return two numbers in the level's range
+
+
+def decideOperation(rng=random):
+    """Randomly decide between addition and subtraction"""
+    return rng.choice(["+", "-"])
+
+
+def make_question(level, rng=random):
+    """Return (num1, operation, num2) for one question"""
+    num1, num2 = randomInt(level, rng)  # Numbers first, then the operation (same order as the quiz)
+    return num1, decideOperation(rng), num2
+
+
+def correct_answer(num1, operation, num2):
+    """Work out the answer to a question"""
+    if operation == "×":
+        return num1 * num2  # Only asked in adaptive mode
+    return num1 + num2 if operation == "+" else num1 - num2
+
+
+def points_for(first_attempt):
+    """Full points for the first try, half for the second"""
+    return FIRST_ATTEMPT_POINTS if first_attempt else SECOND_ATTEMPT_POINTS
+
+
+def grade_for(score):
+    """Convert a score out of 100 into a grade"""
+    for threshold, grade in GRADE_THRESHOLDS:
+        if score >= threshold:
+            return grade
+    return "F"  # Failing grade
+
+# -------------------- QUIZ SESSION --------------------
+
+def session_clock():
+    """Clock returning whole milliseconds since it was created"""
+    start = time.monotonic()
+    return lambda: int((time.monotonic() - start) * 1000)
+
+
+class QuizSession:
+    """State of one 10-question quiz, driven by answers and timeouts.
+
+    stats, if given, is an adaptive.PlayerStats that chooses the questions
+    and is updated after each one. recorder, if given, is told about every
+    question, answer and timeout with the session clock's timestamp. The
+    replayer passes its own clock so timings are reproduced exactly.
+    """
+
+    def __init__(self, level, seed=None, stats=None, recorder=None, clock=None):
+        self.level = level  # Difficulty level chosen in the menu
+        self.seed = seed  # Seed for the question generator (None = unseeded)
+        self.rng = random.Random(seed)  # Private generator so sessions are reproducible
+        self.stats = stats  # Adaptive player stats (None for the fixed levels)
+        self.recorder = recorder  # Optional SessionRecorder
+        self.clock = clock or session_clock()  # Milliseconds since the session started
+        self.score = 0  # Points so far
+        self.question_num = 0  # Current question (1-10), 0 before the first one
+        self.first_attempt = True  # False after one wrong answer
+        self.question = None  # (num1, operation, num2) of the current question
+        self.shown_at = 0  # Clock time the current question was shown
+
+    @property
+    def finished(self):
+        """True once all questions have been asked"""
+        return self.question_num > QUESTIONS_PER_QUIZ
+
+    @property
+    def grade(self):
+        """Grade for the current score"""
+        return grade_for(self.score)
+
+    @property
+    def answer(self):
+        """Correct answer to the current question"""
+        return correct_answer(*self.question)
+
+    def next_question(self):
+        """Move on to the next question; returns it, or None when the quiz is over"""
+        self.question_num += 1
+        self.first_attempt = True  # Reset attempt for the new question
+        if self.finished:
+            self.question = None
+            return None
+        if self.stats:
+            self.question = self.stats.make_question(self.rng)  # Adaptive: stats pick range and operation
+        else:
+            self.question = make_question(self.level, self.rng)
+        self.shown_at = self.clock()
+        if self.recorder:
+            self.recorder.question(self.shown_at)
+        return self.question
+
+    def _finish_question(self, correct, now):
+        """Update the adaptive stats once a question is over"""
+        if self.stats:
+            self.stats.record(correct, not self.first_attempt, now - self.shown_at)
+
+    def submit(self, text):
+        """Check an answer typed by the player.
+
+        Returns one of "invalid", "correct", "retry" or "wrong". After
+        "correct" and "wrong" the caller should call next_question().
+        """
+        now = self.clock()
+        if self.recorder:
+            self.recorder.answer(now, text)
+        try:
+            user_answer = int(text)
+        except ValueError:
+            return "invalid"  # Not a number, the attempt does not count
+
+        if user_answer == self.answer:
+            self.score += points_for(self.first_attempt)
+            self._finish_question(True, now)
+            return "correct"
+        if self.first_attempt:
+            self.first_attempt = False  # Give second chance
+            return "retry"
+        self._finish_question(False, now)
+        return "wrong"  # Wrong twice
+
+    def timeout(self):
+        """The timer ran out; the caller should call next_question()"""
+        now = self.clock()
+        if self.recorder:
+            self.recorder.timeout(now)
+        self._finish_question(False, now)
+        return "timeout"
@@ -0,0 +1,227 @@
+"""Session recording and headless replay for the Arithmetic Quiz.
+
+A recording is a small JSON file holding the session seed and an event
+stream with millisecond timestamps:
+
+    {"v": 1, "level": "easy", "seed": 123, "score": 85, "grade": "A",
+     "events": [[0, "q"], [2140, "a", "7"], [2150, "q"], [12003, "t"], ...]}
+
+    "q"          a question was shown
+    "a", text    the player submitted text from the answer box
+    "t"          the question timer ran out
+
+Adaptive sessions also store "profile", the player's packed stats (hex) at
+the start of the session, so the replay picks the same questions.
+"feedback" says how answers were acknowledged: "inline" toasts, or "modal"
+message boxes for recordings made before the toasts existed. The replay
+summary reports answers per minute for each, to compare the two flows.
+
+Replaying runs the events back through quiz_logic.QuizSession without
+Tkinter or any waiting, so it is much faster than real time.
+
+Command line:
+    python quiz_recording.py RECORDINGS_DIR [--workers N] [--repeat N]
+"""
+
+import argparse  # Command-line options
+import json  # Recording file format
+import os  # File paths
+import random  # Seed generation
+import sys  # Exit status
+import time  # Timestamps and throughput
+from multiprocessing import Pool  # Replay across all CPU cores
+
+from adaptive import PlayerStats
+from quiz_logic import QuizSession, TIME_PER_QUESTION
+
+FORMAT_VERSION = 1  # Bumped if the event format changes
+RECORD_FLAG = "--record"  # Command-line flag that turns recording on
+RECORD_ENV = "QUIZ_RECORD_DIR"  # Or set this to the folder to record into
+DEFAULT_DIR = "recordings"  # Folder used by --record
+FEEDBACK = "inline"  # Feedback style of the current quiz (see module docstring)
+
+
+def recording_dir(argv=None):
+    """Folder to save recordings in, or None if recording is off"""
+    argv = sys.argv if argv is None else argv
+    if os.environ.get(RECORD_ENV):
+        return os.environ[RECORD_ENV]
+    return DEFAULT_DIR if RECORD_FLAG in argv else None
+
+
+def new_seed():
+    """Pick a fresh seed for a session"""
+    return random.SystemRandom().randrange(2 ** 32)
+
+# -------------------- RECORDER --------------------
+
+class SessionRecorder:
+    """Collects the events of one quiz session and saves them to a file.
+
+    QuizSession calls question/answer/timeout with its own clock's time.
+    """
+
+    def __init__(self, level, seed, folder, stats=None):
+        self.level = level
+        self.seed = seed
+        self.folder = folder  # Where the file will be written
+        self.profile = stats.pack().hex() if stats else None  # Adaptive stats at the start
+        self.events = []  # [ms, kind, (text)] entries
+
+    def question(self, ms):
+        self.events.append([ms, "q"])
+
+    def answer(self, ms, text):
+        self.events.append([ms, "a", text])
+
+    def timeout(self, ms):
+        self.events.append([ms, "t"])
+
+    def to_dict(self, score, grade):
+        """Recording as a plain dict"""
+        recording = {"v": FORMAT_VERSION, "level": self.level, "seed": self.seed, "feedback": FEEDBACK,
+                     "score": score, "grade": grade, "events": self.events}
+        if self.profile:
+            recording["profile"] = self.profile
+        return recording
+
+    def save(self, score, grade):
+        """Write the recording; returns the file path (or None on failure)"""
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.seed}.json"
+            path = os.path.join(self.folder, name)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(self.to_dict(score, grade), file, separators=(",", ":"))
+            return path
+        except OSError as e:
+            print(f"Recording error: {e}")  # Never let recording break the quiz
+            return None
+
+# -------------------- REPLAY --------------------
+
+def load_recording(path):
+    """Read a recording file"""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def replay(recording):
+    """Run a recording through the quiz logic and return what happened.
+
+    The result holds the replayed score and grade, whether they match the
+    recorded ones, each question's response time and any timeouts that did
+    not fire after TIME_PER_QUESTION seconds.
+    """
+    now = [0]  # Replay clock, set from each event's timestamp
+    stats = PlayerStats.unpack(bytes.fromhex(recording["profile"])) if recording.get("profile") else None
+    session = QuizSession(recording["level"], recording["seed"], stats=stats, clock=lambda: now[0])
+    questions = []  # One entry per question: [num1, op, num2, shown_ms, outcome, answered_ms]
+    odd_timeouts = []  # (question number, ms after the question was shown)
+    answers = 0  # Answers submitted (for answers per minute)
+    problems = []  # Events that did not fit the quiz flow
+    shown = 0
+
+    for event in recording["events"]:
+        ms, kind = event[0], event[1]
+        now[0] = ms
+        if kind == "q":
+            question = session.next_question()
+            if question is None:
+                problems.append(f"question shown after the quiz ended at {ms} ms")
+                break
+            shown = ms
+            questions.append([*question, ms, None, None])
+        elif session.question is None:
+            problems.append(f"{kind!r} event before any question at {ms} ms")
+            break
+        elif kind == "a":
+            answers += 1
+            outcome = session.submit(event[2])
+            if outcome in ("correct", "wrong"):
+                questions[-1][4:] = [outcome, ms - shown]
+        elif kind == "t":
+            session.timeout()
+            questions[-1][4:] = ["timeout", ms - shown]
+            if abs(ms - shown - TIME_PER_QUESTION * 1000) > 1000:  # Allow one tick of slack
+                odd_timeouts.append((session.question_num, ms - shown))
+        else:
+            problems.append(f"unknown event {kind!r} at {ms} ms")
+
+    duration = recording["events"][-1][0] if recording["events"] else 0
+    return {
+        "score": session.score,
+        "grade": session.grade,
+        "matches": session.score == recording.get("score") and session.grade == recording.get("grade"),
+        "questions": questions,
+        "odd_timeouts": odd_timeouts,
+        "problems": problems,
+        "answers_per_minute": answers * 60000 / duration if duration else 0.0,
+        "feedback": recording.get("feedback", "modal"),
+    }
+
+
+def replay_file(path):
+    """Replay one file for the process pool; errors are returned, not raised"""
+    try:
+        result = replay(load_recording(path))
+    except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+        return path, {"error": str(e)}
+    del result["questions"]  # Keep what goes back to the parent process small
+    return path, result
+
+
+def find_recordings(folder):
+    """All recording files in a folder (sorted so runs are repeatable)"""
+    return sorted(os.path.join(folder, name) for name in os.listdir(folder) if name.endswith(".json"))
+
+
+def replay_directory(folder, workers=None, repeat=1):
+    """Replay every recording in a folder across a pool of processes.
+
+    Yields (path, result) pairs as they finish. repeat > 1 replays each file
+    several times, which is handy as load input.
+    """
+    paths = find_recordings(folder) * repeat
+    if not paths:
+        return
+    chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 8))  # Few, large batches
+    with Pool(workers) as pool:
+        yield from pool.imap_unordered(replay_file, paths, chunksize=chunksize)
+
+# -------------------- COMMAND LINE --------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay recorded quiz sessions headlessly.")
+    parser.add_argument("folder", help="folder of .json recordings")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument("--repeat", type=int, default=1, help="replay each recording this many times")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    total = failed = 0
+    speeds = {}  # feedback style -> answers per minute of each recording
+    for path, result in replay_directory(args.folder, args.workers, args.repeat):
+        total += 1
+        if "error" in result:
+            failed += 1
+            print(f"ERROR    {path}: {result['error']}")
+            continue
+        if result["answers_per_minute"]:
+            speeds.setdefault(result["feedback"], []).append(result["answers_per_minute"])
+        if not result["matches"] or result["problems"]:
+            failed += 1
+            print(f"MISMATCH {path}: replayed {result['score']} ({result['grade']}) {'; '.join(result['problems'])}")
+        for question, ms in result["odd_timeouts"]:
+            print(f"TIMEOUT  {path}: question {question} timed out after {ms} ms")
+    elapsed = time.perf_counter() - start
+
+    print(f"Replayed {total} recordings in {elapsed:.2f} s ({total / elapsed if elapsed else 0:.0f}/s), {failed} failed")
+    for feedback, values in sorted(speeds.items()):
+        print(f"Mean throughput ({feedback} feedback, {len(values)} sessions): "
+              f"{sum(values) / len(values):.1f} answers per minute")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
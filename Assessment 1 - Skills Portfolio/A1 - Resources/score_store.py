@@ -0,0 +1,116 @@
+"""Full score history for the Arithmetic Quiz, kept in SQLite.
+
+Every finished quiz is stored (not just the top 5), with its difficulty and
+the time it was played. Queries are paged and indexed so the leaderboard can
+fetch only the rows it is about to show, even with millions of scores.
+"""
+
+import json  # Import the old leaderboard.json
+import os  # File checks
+import sqlite3  # Built-in database
+import time  # Timestamps
+
+DEFAULT_PATH = "scores.db"  # Database file
+LEGACY_JSON = "leaderboard.json"  # Old top-5 file, imported once
+
+# Leaderboard order: best score first, earlier games win ties
+ORDER = "score DESC, played_at ASC, id ASC"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    difficulty TEXT,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_rank ON scores (score DESC, played_at, id);
+CREATE INDEX IF NOT EXISTS scores_level_rank ON scores (difficulty, score DESC, played_at, id);
+CREATE INDEX IF NOT EXISTS scores_name ON scores (name, score DESC);
+CREATE INDEX IF NOT EXISTS scores_name_level ON scores (name, difficulty, score DESC, played_at, id);
+"""
+
+
+class ScoreStore:
+    """Paged access to every recorded score"""
+
+    def __init__(self, path=DEFAULT_PATH, legacy_json=LEGACY_JSON):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        if legacy_json and self.db.execute("SELECT 1 FROM scores LIMIT 1").fetchone() is None:
+            self.import_legacy(legacy_json)  # First run: keep the old top scores
+
+    def import_legacy(self, path):
+        """Copy entries from the old leaderboard.json (difficulty unknown)"""
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return  # Unreadable old file, start fresh
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO scores (name, score, difficulty, played_at) VALUES (?, ?, NULL, 0)",
+                [(entry["name"], entry["score"]) for entry in entries if "name" in entry and "score" in entry])
+
+    def add(self, name, score, difficulty=None, played_at=None):
+        """Record a finished quiz"""
+        with self.db:
+            self.db.execute(
+                "INSERT INTO scores (name, score, difficulty, played_at) VALUES (?, ?, ?, ?)",
+                (name, score, difficulty, time.time() if played_at is None else played_at))
+
+    @staticmethod
+    def _where(difficulty=None, since=None, until=None):
+        """SQL WHERE clause and parameters for the leaderboard filters"""
+        clauses, params = [], []
+        if difficulty:
+            clauses.append("difficulty = ?")
+            params.append(difficulty)
+        if since is not None:
+            clauses.append("played_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("played_at < ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def count(self, difficulty=None, since=None, until=None):
+        """Number of scores matching the filters"""
+        where, params = self._where(difficulty, since, until)
+        return self.db.execute(f"SELECT COUNT(*) FROM scores{where}", params).fetchone()[0]
+
+    def page(self, offset, limit, difficulty=None, since=None, until=None):
+        """Rows offset..offset+limit in leaderboard order.
+
+        Each row is (rank, name, score, difficulty, played_at).
+        """
+        where, params = self._where(difficulty, since, until)
+        rows = self.db.execute(
+            f"SELECT name, score, difficulty, played_at FROM scores{where} ORDER BY {ORDER} LIMIT ? OFFSET ?",
+            params + [limit, offset]).fetchall()
+        return [(offset + i + 1, *row) for i, row in enumerate(rows)]
+
+    def best_rank(self, name, difficulty=None, since=None, until=None):
+        """Rank and row of a player's best score under the filters, or None"""
+        where, params = self._where(difficulty, since, until)
+        prefix = where + " AND" if where else " WHERE"
+        best = self.db.execute(
+            f"SELECT id, score, difficulty, played_at FROM scores{prefix} name = ? ORDER BY {ORDER} LIMIT 1",
+            params + [name]).fetchone()
+        if best is None:
+            return None
+        row_id, score, level, played_at = best
+        # Everything that sorts before the player's best row is ranked above it.
+        # Two simple range counts let SQLite walk the score index instead of scanning.
+        higher = self.db.execute(f"SELECT COUNT(*) FROM scores{prefix} score > ?",
+                                 params + [score]).fetchone()[0]
+        tied = self.db.execute(f"SELECT COUNT(*) FROM scores{prefix} score = ? AND (played_at, id) < (?, ?)",
+                               params + [score, played_at, row_id]).fetchone()[0]
+        ahead = higher + tied
+        return ahead + 1, name, score, level, played_at
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,242 @@
+"""Opt-in event-loop diagnostics for the Tkinter apps in this folder.
+
+Turn it on with the --diagnostics command-line flag or TK_DIAGNOSTICS=1.
+When it is off, install() returns straight away and nothing is patched,
+so the apps run exactly as before.
+
+Environment variables (only read when diagnostics are on):
+    TK_DIAG_THRESHOLD_MS   log callbacks slower than this (default 50)
+    TK_DIAG_PROFILE        1 = run sampled callbacks under cProfile
+    TK_DIAG_TRACEMALLOC    1 = measure memory growth of sampled callbacks
+    TK_DIAG_SAMPLE_EVERY   sample one callback in every N (default 10)
+    TK_DIAG_REPORT         report file path (default <app>_diagnostics.txt)
+"""
+
+import atexit  # Write the report when the interpreter exits
+import cProfile  # Optional callback profiling
+import io  # In-memory buffer for the pstats output
+import os  # Environment variables
+import pstats  # Format the cProfile results
+import sys  # Command-line flags and stderr logging
+import time  # High resolution timer
+import tkinter as tk  # The module we hook into
+import tracemalloc  # Optional memory sampling
+
+# -------------------- SETTINGS --------------------
+
+FLAG = "--diagnostics"  # Command-line flag that enables diagnostics
+ENV_VAR = "TK_DIAGNOSTICS"  # Environment variable that enables diagnostics
+
+
+def is_enabled(argv=None):
+    """Return True if diagnostics were requested by flag or environment"""
+    argv = sys.argv if argv is None else argv
+    return FLAG in argv or os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+def _env_flag(name):
+    """Read a 0/1 style environment switch"""
+    return os.environ.get(name, "") not in ("", "0")
+
+
+def _env_number(name, default, kind):
+    """Read a numeric environment setting, falling back to the default if it is bad"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return kind(value)
+    except ValueError:
+        print(f"[diagnostics] ignoring {name}={value!r}, using {default}", file=sys.stderr)
+        return default
+
+
+def _callback_name(func):
+    """Readable name for a callback (lambdas get their qualified name)"""
+    name = getattr(func, "__name__", type(func).__name__)
+    if name == "<lambda>":
+        name = getattr(func, "__qualname__", name)  # e.g. JokeTellerApp.fade_in.<locals>.<lambda>
+    return name
+
+
+def _percentile(values, fraction):
+    """Simple nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+# -------------------- MONITOR --------------------
+
+class EventLoopMonitor:
+    """Measures after() drift and callback run time for one Tk app"""
+
+    def __init__(self, app_name, threshold_ms=50.0, profile=False,
+                 trace_memory=False, sample_every=10, report_path=None):
+        self.app_name = app_name  # Used in the report title and file name
+        self.threshold_ms = threshold_ms  # Callbacks slower than this are logged
+        self.profile = profile  # Run sampled callbacks under cProfile
+        self.trace_memory = trace_memory  # Track memory growth of sampled callbacks
+        self.sample_every = max(1, sample_every)  # Sample 1 in N callbacks
+        self.report_path = report_path or f"{app_name}_diagnostics.txt"
+
+        self.started = time.perf_counter()  # Session start time
+        self.drift_ms = []  # How late each after() callback fired
+        self.worst_drift = {}  # Callback name -> worst drift seen
+        self.callback_stats = {}  # Callback name -> [calls, total ms, max ms]
+        self.slow_callbacks = []  # (time since start, name, ms) over threshold
+        self.memory_growth = {}  # Callback name -> bytes allocated while sampled
+        self.calls = 0  # Total callbacks seen (used for sampling)
+        self.depth = 0  # Nesting depth (modal dialogs run callbacks inside callbacks)
+        self.profiler = cProfile.Profile() if profile else None
+
+    # ---------- hooks ----------
+
+    def wrap_after(self, ms, func):
+        """Wrap an after() callback so it records how late it fired"""
+        due = time.perf_counter() + ms / 1000.0  # When Tk should run it
+        name = "after:" + _callback_name(func)
+
+        def timed(*args):
+            drift = (time.perf_counter() - due) * 1000.0  # Lateness in ms
+            self.drift_ms.append(drift)
+            if drift > self.worst_drift.get(name, float("-inf")):
+                self.worst_drift[name] = drift
+            return func(*args)
+
+        timed.__name__ = name  # Tkinter copies this onto its internal callit()
+        return timed
+
+    def run_callback(self, name, call):
+        """Time one Tk -> Python callback and optionally sample it"""
+        self.calls += 1
+        sampled = self.depth == 0 and self.calls % self.sample_every == 0
+        self.depth += 1
+        if sampled and self.profiler:
+            self.profiler.enable()
+        if sampled and self.trace_memory:
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            return call()
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            self.depth -= 1
+            if sampled and self.profiler:
+                self.profiler.disable()
+            if sampled and self.trace_memory:
+                grown = tracemalloc.get_traced_memory()[0] - before
+                self.memory_growth[name] = self.memory_growth.get(name, 0) + grown
+            self.record(name, elapsed)
+
+    def record(self, name, elapsed):
+        """Add a callback duration to the stats and log it if it was slow"""
+        stats = self.callback_stats.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+        if elapsed >= self.threshold_ms:
+            at = time.perf_counter() - self.started
+            self.slow_callbacks.append((at, name, elapsed))
+            print(f"[diagnostics] slow callback {name}: {elapsed:.1f} ms", file=sys.stderr)
+
+    # ---------- report ----------
+
+    def report(self):
+        """Build the text report"""
+        out = io.StringIO()
+        runtime = time.perf_counter() - self.started
+        out.write(f"Event-loop diagnostics for {self.app_name}\n")
+        out.write(f"Run time: {runtime:.1f} s, callbacks: {self.calls}\n\n")
+
+        out.write("== after() scheduling drift ==\n")
+        if self.drift_ms:
+            mean = sum(self.drift_ms) / len(self.drift_ms)
+            out.write(f"fired: {len(self.drift_ms)}  mean: {mean:.1f} ms  "
+                      f"p95: {_percentile(self.drift_ms, 0.95):.1f} ms  "
+                      f"max: {max(self.drift_ms):.1f} ms\n")
+            worst = sorted(self.worst_drift.items(), key=lambda x: x[1], reverse=True)[:10]
+            for name, drift in worst:
+                out.write(f"  {drift:9.1f} ms  {name}\n")
+        else:
+            out.write("no after() callbacks fired\n")
+
+        out.write(f"\n== callbacks over {self.threshold_ms:.0f} ms ==\n")
+        for at, name, elapsed in self.slow_callbacks:
+            out.write(f"  t={at:8.2f}s  {elapsed:9.1f} ms  {name}\n")
+        if not self.slow_callbacks:
+            out.write("none\n")
+
+        out.write("\n== callback totals (by total time) ==\n")
+        totals = sorted(self.callback_stats.items(), key=lambda x: x[1][1], reverse=True)[:20]
+        for name, (count, total, worst) in totals:
+            out.write(f"  {count:6d} calls  {total:10.1f} ms total  {worst:9.1f} ms max  {name}\n")
+
+        if self.memory_growth:
+            out.write("\n== memory allocated by sampled callbacks ==\n")
+            grown = sorted(self.memory_growth.items(), key=lambda x: x[1], reverse=True)[:10]
+            for name, size in grown:
+                out.write(f"  {size / 1024:10.1f} KiB  {name}\n")
+
+        if self.profiler:
+            out.write(f"\n== cProfile of sampled callbacks (1 in {self.sample_every}) ==\n")
+            try:
+                pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(25)
+            except TypeError:
+                out.write("no callbacks were sampled\n")  # pstats raises if the profile is empty
+        return out.getvalue()
+
+    def write_report(self):
+        """Save the report to disk (called at exit)"""
+        try:
+            with open(self.report_path, "w", encoding="utf-8") as file:
+                file.write(self.report())
+            print(f"[diagnostics] report written to {self.report_path}", file=sys.stderr)
+        except OSError as e:
+            print(f"[diagnostics] could not write report: {e}", file=sys.stderr)
+
+# -------------------- INSTALL --------------------
+
+_monitor = None  # Only one monitor per process
+
+
+def install(app_name, argv=None):
+    """Enable diagnostics for this process if requested; returns the monitor or None"""
+    global _monitor
+    if _monitor is not None or not is_enabled(argv):
+        return _monitor  # Off (or already on): leave tkinter untouched
+
+    _monitor = monitor = EventLoopMonitor(
+        app_name,
+        threshold_ms=_env_number("TK_DIAG_THRESHOLD_MS", 50.0, float),
+        profile=_env_flag("TK_DIAG_PROFILE"),
+        trace_memory=_env_flag("TK_DIAG_TRACEMALLOC"),
+        sample_every=_env_number("TK_DIAG_SAMPLE_EVERY", 10, int),
+        report_path=os.environ.get("TK_DIAG_REPORT"),
+    )
+    if monitor.trace_memory:
+        tracemalloc.start()
+
+    original_after = tk.Misc.after
+    original_call = tk.CallWrapper.__call__
+
+    def after(widget, ms, func=None, *args):
+        if func is not None:
+            try:
+                delay = int(ms)  # Tk also accepts numeric strings
+            except (TypeError, ValueError):
+                delay = None  # after_idle() passes 'idle': no due time, leave it unwrapped
+            if delay is not None:
+                func = monitor.wrap_after(delay, func)  # Measure drift of scheduled callbacks
+        return original_after(widget, ms, func, *args)
+
+    def call(wrapper, *args):
+        # Every Tk -> Python callback (buttons, after(), events) goes through here
+        name = _callback_name(wrapper.func)
+        return monitor.run_callback(name, lambda: original_call(wrapper, *args))
+
+    tk.Misc.after = after
+    tk.CallWrapper.__call__ = call
+    atexit.register(monitor.write_report)
+    print(f"[diagnostics] enabled for {app_name}", file=sys.stderr)
+    return monitor